@@ -1,5 +1,6 @@
 """Support for Fellow Stagg EKG+ kettles."""
 import logging
+from dataclasses import asdict, replace
 from datetime import timedelta
 from typing import Any
 
@@ -9,15 +10,23 @@ from homeassistant.components.bluetooth import (
     async_scanner_by_source,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform, UnitOfTemperature
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP, Platform, UnitOfTemperature
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
 )
 from homeassistant.helpers.device_registry import DeviceInfo
 
-from .const import DOMAIN, CONF_POLLING_INTERVAL, DEFAULT_POLLING_INTERVAL
-from .kettle_ble import KettleBLEClient
+from .const import (
+  DOMAIN,
+  COMMAND_COOLDOWN,
+  CONF_POLLING_INTERVAL,
+  DEFAULT_POLLING_INTERVAL,
+  HEATING_POLLING_INTERVAL,
+)
+from .kettle_ble import KettleBLEClient, KettleState
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -42,10 +51,20 @@ class FellowStaggDataUpdateCoordinator(DataUpdateCoordinator):
       update_interval=polling_interval,
     )
     self.kettle = KettleBLEClient(address)
+    self.idle_update_interval = polling_interval  # used while the kettle is off
     self.ble_device = None
     self._address = address
     self.entry_id = entry_id
     self._last_service_info = None  # cached for idle-kettle directed connect
+    self._pending_commands: dict[str, Any] = {}  # staged until the batch is sent
+    self._stopped = False  # set once Home Assistant stops or the entry unloads
+    self._command_debouncer = Debouncer(
+      hass,
+      _LOGGER,
+      cooldown=COMMAND_COOLDOWN,
+      immediate=True,
+      function=self._async_send_pending_commands,
+    )
 
     self.device_info = DeviceInfo(
       identifiers={(DOMAIN, address)},
@@ -57,7 +76,7 @@ class FellowStaggDataUpdateCoordinator(DataUpdateCoordinator):
   @property
   def temperature_unit(self) -> str:
     """Get the current temperature unit."""
-    return UnitOfTemperature.FAHRENHEIT if self.data and self.data.get("units") == "F" else UnitOfTemperature.CELSIUS
+    return UnitOfTemperature.FAHRENHEIT if self.data is not None and self.data.units == "F" else UnitOfTemperature.CELSIUS
 
   @property
   def min_temp(self) -> float:
@@ -69,6 +88,109 @@ class FellowStaggDataUpdateCoordinator(DataUpdateCoordinator):
     """Get the maximum temperature based on current units."""
     return MAX_TEMP_F if self.temperature_unit == UnitOfTemperature.FAHRENHEIT else MAX_TEMP_C
 
+  @callback
+  def async_set_optimistic_data(self, **changes: Any) -> None:
+    """Merge commanded values into the current data and notify listeners.
+
+    The next poll reconciles these with what the kettle actually reports.
+    """
+    data = replace(self.data or KettleState(), **changes)
+    self._async_adapt_update_interval(data)
+    self.async_set_updated_data(data)
+
+  @callback
+  def _async_adapt_update_interval(self, data: KettleState) -> None:
+    """Poll quickly while the kettle is heating, at the configured rate otherwise."""
+    if data.power:
+      self.update_interval = timedelta(seconds=HEATING_POLLING_INTERVAL)
+    else:
+      self.update_interval = self.idle_update_interval
+
+  async def async_set_power(self, power: bool) -> None:
+    """Send a power change, or queue it if a command was just sent.
+
+    The first toggle is written at once. Toggles within the cooldown after it
+    are merged into one trailing write of the last requested state, which is
+    sent even if it matches the state already written.
+    """
+    if self._stopped:
+      return
+    self._pending_commands["power"] = power
+    await self._command_debouncer.async_call()
+
+  async def async_set_target_temp(self, temp: int) -> None:
+    """Send a target temperature change, or queue it if a command was just sent."""
+    if self._stopped:
+      return
+    self._pending_commands["temp"] = temp
+    await self._command_debouncer.async_call()
+
+  async def _async_send_pending_commands(self) -> None:
+    """Send all staged commands to the kettle over one connection.
+
+    Raises HomeAssistantError if a batch cannot be sent. Commands staged
+    meanwhile are dropped with it, and a refresh replaces the optimistic state.
+    """
+    # Commands staged while a batch is being written are picked up here,
+    # since the debouncer ignores calls made while this is running.
+    while self._pending_commands:
+      commands, self._pending_commands = self._pending_commands, {}
+      ble_device = self.get_ble_device_for_connect()
+      if ble_device is None:
+        self._pending_commands.clear()
+        self.async_schedule_command_refresh()
+        raise HomeAssistantError(
+          f"Kettle {self._address} has not been seen yet; commands {commands} not sent"
+        )
+      _LOGGER.debug("Sending commands to kettle %s: %s", self._address, commands)
+      try:
+        await self.kettle.async_set_state(
+          ble_device,
+          fahrenheit=self.temperature_unit == UnitOfTemperature.FAHRENHEIT,
+          **commands,
+        )
+      except Exception as err:
+        self._pending_commands.clear()
+        self.async_schedule_command_refresh()
+        raise HomeAssistantError(
+          f"Error sending commands {commands} to kettle {self._address}: {err}"
+        ) from err
+    self.async_schedule_command_refresh()
+
+  @callback
+  def async_schedule_command_refresh(self) -> None:
+    """Request a refresh after a command without waiting for it.
+
+    async_request_refresh is debounced, so rapid commands collapse into one poll.
+    """
+    if self._stopped:
+      return
+    self.hass.async_create_background_task(
+      self.async_request_refresh(),
+      f"{DOMAIN} refresh after command {self._address}",
+      eager_start=True,
+    )
+
+  async def async_stop(self, _event: Event | None = None) -> None:
+    """Drop pending commands, stop polling and close the kettle connection."""
+    self._stopped = True
+    self._pending_commands.clear()
+    self._command_debouncer.async_cancel()
+    self._unschedule_refresh()
+    await self.kettle.disconnect()
+
+  @callback
+  def _schedule_refresh(self) -> None:
+    """Schedule the next poll unless the coordinator has been stopped."""
+    if self._stopped:
+      return
+    super()._schedule_refresh()
+
+  async def async_shutdown(self) -> None:
+    """Cancel pending work and disconnect when the config entry is unloaded."""
+    await self.async_stop()
+    await super().async_shutdown()
+
   def _inject_cached_ble_device(self) -> None:
     """Re-insert the last known service info into the BLE scanner cache.
 
@@ -107,8 +229,10 @@ class FellowStaggDataUpdateCoordinator(DataUpdateCoordinator):
       return self._last_service_info.device
     return None
 
-  async def _async_update_data(self) -> dict[str, Any] | None:
+  async def _async_update_data(self) -> KettleState | None:
     """Fetch data from the kettle."""
+    if self._stopped:
+      return self.data
     _LOGGER.debug("Starting poll for Fellow Stagg kettle %s", self._address)
 
     self.ble_device = async_ble_device_from_address(self.hass, self._address, True)
@@ -125,6 +249,7 @@ class FellowStaggDataUpdateCoordinator(DataUpdateCoordinator):
           "No advertisement and no cached service info for %s; skipping poll",
           self._address,
         )
+        self._async_adapt_update_interval(KettleState())
         return None
 
     try:
@@ -142,15 +267,18 @@ class FellowStaggDataUpdateCoordinator(DataUpdateCoordinator):
         self._last_service_info = fresh_info
 
       # Log any changes in data compared to previous state
-      if self.data is not None:
+      if self.data is not None and data is not None and _LOGGER.isEnabledFor(logging.DEBUG):
+        old = asdict(self.data)
         changes = {
-          k: (self.data.get(k), v)
-          for k, v in data.items()
-          if k in self.data and self.data.get(k) != v
+          k: (old[k], v)
+          for k, v in asdict(data).items()
+          if old[k] != v
         }
         if changes:
           _LOGGER.debug("Data changes detected: %s", changes)
 
+      # Fall back to the idle rate while the kettle cannot be reached
+      self._async_adapt_update_interval(data if data is not None else KettleState())
       return data
     except Exception as e:
       _LOGGER.error(
@@ -158,6 +286,7 @@ class FellowStaggDataUpdateCoordinator(DataUpdateCoordinator):
         self._address,
         str(e),
       )
+      self._async_adapt_update_interval(KettleState())
       return None
 
 
@@ -181,6 +310,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
   await coordinator.async_config_entry_first_refresh()
 
   hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
+  entry.async_on_unload(
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, coordinator.async_stop)
+  )
 
   await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
@@ -192,7 +324,8 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
   """Unload a config entry."""
   _LOGGER.debug("Unloading Fellow Stagg integration for entry: %s", entry.entry_id)
   if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-    hass.data[DOMAIN].pop(entry.entry_id)
+    coordinator = hass.data[DOMAIN].pop(entry.entry_id)
+    await coordinator.async_shutdown()
   return unload_ok
 
 
@@ -6,6 +6,7 @@ from homeassistant import config_entries
 from homeassistant.components.bluetooth import (
     BluetoothServiceInfoBleak,
     async_discovered_service_info,
+    async_last_service_info,
 )
 from homeassistant.data_entry_flow import FlowResult
 
@@ -72,13 +73,18 @@ class FellowStaggConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Handle the manual entry step."""
         errors = {}
         if user_input is not None:
-            address = user_input["bluetooth_address"]
+            # Bluetooth addresses are upper case in Home Assistant
+            address = user_input["bluetooth_address"].strip().upper()
             await self.async_set_unique_id(address)
             self._abort_if_unique_id_configured()
-            return self.async_create_entry(
-                title=f"Fellow Stagg ({address})",
-                data=user_input,
-            )
+            # The kettle can only be reached once it has been seen advertising
+            if async_last_service_info(self.hass, address, connectable=True) is None:
+                errors["bluetooth_address"] = "device_not_found"
+            else:
+                return self.async_create_entry(
+                    title=f"Fellow Stagg ({address})",
+                    data={"bluetooth_address": address},
+                )
 
         return self.async_show_form(
             step_id="manual",
@@ -4,6 +4,21 @@ CONF_POLLING_INTERVAL = "polling_interval"
 DEFAULT_POLLING_INTERVAL = 5   # seconds
 MIN_POLLING_INTERVAL = 5
 MAX_POLLING_INTERVAL = 60
+HEATING_POLLING_INTERVAL = 2  # seconds, while the kettle is powered on
+
+# The first command is sent at once; further commands within this window are
+# merged into one trailing batch of their latest values, sent when it ends
+# (seconds)
+COMMAND_COOLDOWN = 0.3
+
+# Reconnect backoff after failed connection attempts (seconds)
+RECONNECT_BACKOFF_BASE = 1
+RECONNECT_BACKOFF_MAX = 30
+
+# Stop polling an unreachable kettle after this many consecutive failed
+# connects, for this many seconds
+CIRCUIT_BREAKER_THRESHOLD = 3
+CIRCUIT_BREAKER_COOLDOWN = 60
 
 # BLE UUIDs for the Fellow Stagg kettle’s “Serial Port Service”
 SERVICE_UUID = "00001820-0000-1000-8000-00805f9b34fb"
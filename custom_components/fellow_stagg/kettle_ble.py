@@ -1,47 +1,184 @@
 import asyncio
 import logging
-from bleak import BleakClient
-from bleak_retry_connector import establish_connection
-from .const import SERVICE_UUID, CHAR_UUID, INIT_SEQUENCE
+import random
+import struct
+from dataclasses import dataclass
+from bleak_retry_connector import BleakClientWithServiceCache, establish_connection
+from .const import (
+    CHAR_UUID,
+    CIRCUIT_BREAKER_COOLDOWN,
+    CIRCUIT_BREAKER_THRESHOLD,
+    INIT_SEQUENCE,
+    RECONNECT_BACKOFF_BASE,
+    RECONNECT_BACKOFF_MAX,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# Every kettle frame starts with these two bytes
+_FRAME_MAGIC = b"\xef\xdd"
+
+# Frame header: magic as one big-endian uint16 (0xEFDD), message type
+_FRAME_HEADER = struct.Struct(">HB")
+
+# Temperature payload: temperature byte, unit byte (1 = F, else C)
+_TEMP_PAYLOAD = struct.Struct("BB")
+
+# Command frame: magic (2), flag, sequence, type, value, checksum 1, checksum 2
+_COMMAND = struct.Struct("8B")
+
+# One connect at a time across all kettles so they don't contend for the adapter
+_CONNECT_SEMAPHORE = asyncio.Semaphore(1)
+
+# Accepted target temperature range keyed by "is Fahrenheit"
+_TEMP_BOUNDS: dict[bool, tuple[int, int]] = {True: (104, 212), False: (40, 100)}
+
+
+@dataclass(slots=True, frozen=True)
+class KettleState:
+    """Kettle state parsed from one poll; fields not reported are None."""
+
+    power: bool | None = None
+    hold: bool | None = None
+    target_temp: int | None = None
+    current_temp: int | None = None
+    units: str | None = None  # "F" or "C"
+    countdown: int | None = None
+    lifted: bool | None = None
+
+
+def _parse_power(mv, off, state):
+    """Power state (1 = on, 0 = off)."""
+    state["power"] = True if mv[off] else False
+
+
+def _parse_hold(mv, off, state):
+    """Hold state (1 = hold, 0 = normal)."""
+    state["hold"] = True if mv[off] else False
+
+
+def _parse_target_temp(mv, off, state):
+    """Target temperature and units."""
+    temp, unit = _TEMP_PAYLOAD.unpack_from(mv, off)
+    state["target_temp"] = temp
+    state["units"] = "F" if unit == 1 else "C"
+
+
+def _parse_current_temp(mv, off, state):
+    """Current temperature and units."""
+    temp, unit = _TEMP_PAYLOAD.unpack_from(mv, off)
+    state["current_temp"] = temp
+    state["units"] = "F" if unit == 1 else "C"
+
+
+def _parse_countdown(mv, off, state):
+    """Countdown."""
+    state["countdown"] = mv[off]
+
+
+def _parse_lifted(mv, off, state):
+    """Kettle position (0 = lifted, 1 = on base)."""
+    state["lifted"] = not mv[off]
+
+
+# Total frame length (header + payload) and payload parser by message type
+_MSG_HANDLERS = {
+    0: (4, _parse_power),
+    1: (4, _parse_hold),
+    2: (5, _parse_target_temp),
+    3: (5, _parse_current_temp),
+    4: (4, _parse_countdown),
+    8: (4, _parse_lifted),
+}
+
 
 class KettleBLEClient:
     """BLE client for the Fellow Stagg EKG+ kettle."""
 
+    char_uuid = CHAR_UUID
+    init_sequence = INIT_SEQUENCE
+
     def __init__(self, address: str):
         self.address = address
-        self.service_uuid = SERVICE_UUID
-        self.char_uuid = CHAR_UUID
-        self.init_sequence = INIT_SEQUENCE
         self._client = None
+        self._is_connected = False  # Cleared by bleak's disconnected callback
+        self._authenticated = False  # Init sequence accepted on current connection
+        self._connect_failures = 0  # Consecutive failed connection attempts
+        self._circuit_open_until = 0.0  # Loop time until which polls skip connecting
+        self._write_response = True  # False if the characteristic accepts write-without-response
         self._sequence = 0  # For command sequence numbering
-        self._last_command_time = 0  # For debouncing commands
+        self._last_command_time = 0.0  # Loop time of last write, for debouncing
+        self._rx_buf = bytearray()  # Notification bytes received during a poll
+        self._snapshot_event = None  # Set once a poll has seen every message type
+        self._seen_types = set()  # Message types of complete frames in this poll
+        self._scan_pos = 0  # Offset in _rx_buf where frame tracking resumes
+        self._disconnect_task = None  # Pending background disconnect after an error
+        self._lock = asyncio.Lock()  # One poll or command at a time on the connection
+        self._closed = False  # Set by disconnect(); no reconnects afterwards
 
     async def _ensure_connected(self, ble_device):
         """Ensure BLE connection is established."""
-        if self._client is None or not self._client.is_connected:
+        if self._client is None or not self._is_connected:
+            if self._disconnect_task is not None:
+                # Let the previous connection finish closing before reconnecting
+                await self._disconnect_task
+                self._disconnect_task = None
             _LOGGER.debug("Connecting to kettle at %s", self.address)
-            self._client = await establish_connection(
-                BleakClient, ble_device, self.address, max_attempts=3
+            self._authenticated = False
+            try:
+                async with _CONNECT_SEMAPHORE:
+                    self._client = await establish_connection(
+                        BleakClientWithServiceCache,
+                        ble_device,
+                        self.address,
+                        disconnected_callback=self._on_disconnect,
+                        max_attempts=3,
+                    )
+            except Exception:
+                self._connect_failures += 1
+                if self._connect_failures >= CIRCUIT_BREAKER_THRESHOLD:
+                    self._circuit_open_until = (
+                        asyncio.get_running_loop().time() + CIRCUIT_BREAKER_COOLDOWN
+                    )
+                raise
+            self._is_connected = True
+            self._connect_failures = 0
+            char = self._client.services.get_characteristic(self.char_uuid)
+            self._write_response = (
+                char is None or "write-without-response" not in char.properties
             )
+        if not self._authenticated:
             await self._authenticate()
 
+    def _on_disconnect(self, client):
+        """Handle the kettle dropping the connection."""
+        if client is not self._client:
+            return
+        _LOGGER.debug("Kettle %s disconnected", self.address)
+        self._is_connected = False
+        self._authenticated = False
+
     async def _ensure_debounce(self):
         """Ensure we don't send commands too frequently."""
-        import time
-        current_time = int(time.time() * 1000)  # Current time in milliseconds
-        if current_time - self._last_command_time < 200:  # 200ms debounce
-            await asyncio.sleep(0.2)  # Wait 200ms
-        self._last_command_time = current_time
+        loop = asyncio.get_running_loop()
+        elapsed = loop.time() - self._last_command_time
+        if elapsed < 0.2:  # 200ms debounce
+            await asyncio.sleep(0.2 - elapsed)
+        self._last_command_time = loop.time()
+
+    async def _write(self, data: bytes):
+        """Write a frame to the kettle characteristic."""
+        await self._client.write_gatt_char(
+            self.char_uuid, data, response=self._write_response
+        )
 
     async def _authenticate(self):
         """Send authentication sequence to kettle."""
         try:
             _LOGGER.debug("Writing init sequence to characteristic %s", self.char_uuid)
             await self._ensure_debounce()
-            await self._client.write_gatt_char(self.char_uuid, self.init_sequence)
+            await self._write(self.init_sequence)
+            self._authenticated = True
         except Exception as err:
             _LOGGER.error("Error writing init sequence: %s", err)
             raise
@@ -58,100 +195,191 @@ class KettleBLEClient:
         - Byte 6: Checksum 1 (sequence + value)
         - Byte 7: Checksum 2 (command type)
         """
-        command = bytearray([
+        seq = self._sequence
+        self._sequence = (seq + 1) & 0xFF
+        return _COMMAND.pack(
             0xef, 0xdd,  # Magic
             0x0a,        # Command flag
-            self._sequence,  # Sequence number
-            command_type,    # Command type
-            value,          # Value
-            (self._sequence + value) & 0xFF,  # Checksum 1
-            command_type    # Checksum 2
-        ])
-        self._sequence = (self._sequence + 1) & 0xFF
-        return bytes(command)
-
-    async def async_poll(self, ble_device):
-        """Connect to the kettle, send init command, and return parsed state."""
-        try:
-            await self._ensure_connected(ble_device)
-            notifications = []
+            seq,         # Sequence number
+            command_type,  # Command type
+            value,       # Value
+            (seq + value) & 0xFF,  # Checksum 1
+            command_type  # Checksum 2
+        )
+
+    def _handle_notification(self, _sender, data):
+        """Accumulate notification payloads for the current poll."""
+        self._rx_buf.extend(data)
+        if self._snapshot_event is not None:
+            self._track_frames()
+
+    def _track_frames(self):
+        """Record the types of frames completed since the last notification."""
+        buf = self._rx_buf
+        end = len(buf)
+        i = self._scan_pos
+        while (i := buf.find(_FRAME_MAGIC, i)) >= 0 and i + 3 <= end:
+            handler = _MSG_HANDLERS.get(buf[i + 2])
+            if handler is None:
+                i += 1
+                continue
+            if i + handler[0] > end:
+                break  # Rest of the frame is still to come
+            self._seen_types.add(buf[i + 2])
+            i += handler[0]
+        # Resume at an incomplete frame, or at a trailing magic byte
+        self._scan_pos = i if i >= 0 else max(end - 1, self._scan_pos)
+        if self._seen_types.issuperset(_MSG_HANDLERS):
+            self._snapshot_event.set()
 
-            def notification_handler(sender, data):
-                notifications.append(data)
+    async def async_poll(self, ble_device) -> KettleState | None:
+        """Connect to the kettle and return its parsed state, or None on failure."""
+        if (
+            self._connect_failures >= CIRCUIT_BREAKER_THRESHOLD
+            and asyncio.get_running_loop().time() < self._circuit_open_until
+        ):
+            _LOGGER.debug(
+                "Kettle %s unreachable after %d attempts; skipping poll until cooldown ends",
+                self.address, self._connect_failures,
+            )
+            return None
+
+        if self._connect_failures and not self._is_connected:
+            # Back off before reconnecting for a poll, without holding the
+            # lock, so user commands still connect straight away.
+            # Full jitter keeps clients sharing an adapter from retrying in lockstep
+            cap = min(
+                RECONNECT_BACKOFF_BASE * 2 ** (self._connect_failures - 1),
+                RECONNECT_BACKOFF_MAX,
+            )
+            await asyncio.sleep(random.uniform(0, cap))
 
+        async with self._lock:
+            if self._closed:
+                return None
             try:
-                await self._client.start_notify(self.char_uuid, notification_handler)
-                await asyncio.sleep(2.0)
-                await self._client.stop_notify(self.char_uuid)
-            except Exception as err:
-                _LOGGER.error("Error during notifications: %s", err)
-                return {}
+                await self._ensure_connected(ble_device)
+                self._rx_buf.clear()
+                self._seen_types.clear()
+                self._scan_pos = 0
+                self._snapshot_event = asyncio.Event()
 
-            state = self.parse_notifications(notifications)
-            return state
+                try:
+                    await self._client.start_notify(self.char_uuid, self._handle_notification)
+                    # Stop listening once every message type has been received
+                    try:
+                        async with asyncio.timeout(2.0):
+                            await self._snapshot_event.wait()
+                    except TimeoutError:
+                        pass
+                    await self._client.stop_notify(self.char_uuid)
+                except Exception as err:
+                    _LOGGER.error("Error during notifications: %s", err)
+                    return None
+                finally:
+                    self._snapshot_event = None
 
-        except Exception as err:
-            _LOGGER.error("Error polling kettle: %s", err)
-            if self._client and self._client.is_connected:
-                await self._client.disconnect()
-            self._client = None
-            return {}
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug(
+                        "Received %d notification bytes from %s: %s",
+                        len(self._rx_buf), self.address, self._rx_buf.hex(),
+                    )
+                state = self.parse_notifications(self._rx_buf)
+                return state
+
+            except Exception as err:
+                _LOGGER.error("Error polling kettle: %s", err)
+                self._disconnect_in_background()
+                return None
 
     async def async_set_power(self, ble_device, power_on: bool):
         """Turn the kettle on or off."""
-        try:
-            await self._ensure_connected(ble_device)
-            await self._ensure_debounce()
-            command = self._create_command(0, 1 if power_on else 0)
-            await self._client.write_gatt_char(self.char_uuid, command)
-        except Exception as err:
-            _LOGGER.error("Error setting power state: %s", err)
-            if self._client and self._client.is_connected:
-                await self._client.disconnect()
-            self._client = None
-            raise
+        await self.async_set_state(ble_device, power=power_on)
 
     async def async_set_temperature(self, ble_device, temp: int, fahrenheit: bool = True):
         """Set target temperature."""
-        # Temperature validation from C++ setTemp method
-        if fahrenheit:
-            if temp > 212:
-                temp = 212
-            if temp < 104:
-                temp = 104
-        else:
-            if temp > 100:
-                temp = 100
-            if temp < 40:
-                temp = 40
+        await self.async_set_state(ble_device, temp=temp, fahrenheit=fahrenheit)
+
+    async def async_set_state(
+        self,
+        ble_device,
+        power: bool | None = None,
+        temp: int | None = None,
+        fahrenheit: bool = True,
+    ):
+        """Set target temperature and/or power in one batch of writes.
+
+        The frames are debounced once and written back to back, rather than
+        paying the command debounce for each of them.
+        """
+        commands = []
+        if temp is not None:
+            # Temperature validation from C++ setTemp method
+            lo, hi = _TEMP_BOUNDS[fahrenheit]
+            temp = max(lo, min(hi, temp))
+            commands.append(self._create_command(1, temp))  # Type 1 = temperature
+        if power is not None:
+            commands.append(self._create_command(0, 1 if power else 0))  # Type 0 = power
+        if not commands:
+            return
 
+        async with self._lock:
+            if self._closed:
+                _LOGGER.debug("Kettle %s client closed; not sending commands", self.address)
+                return
+            try:
+                await self._ensure_connected(ble_device)
+                await self._ensure_debounce()
+                for command in commands:
+                    await self._write(command)
+            except Exception as err:
+                _LOGGER.error("Error sending commands to kettle: %s", err)
+                self._disconnect_in_background()
+                raise
+
+    def _disconnect_in_background(self):
+        """Drop the connection after an error without waiting for it to close."""
+        client = self._client
+        self._client = None
+        self._is_connected = False
+        self._authenticated = False
+        if client is not None:
+            self._disconnect_task = asyncio.create_task(self._close_client(client))
+
+    async def _close_client(self, client):
+        """Close a dropped client, ignoring errors from a broken link."""
         try:
-            await self._ensure_connected(ble_device)
-            await self._ensure_debounce()
-            command = self._create_command(1, temp)  # Type 1 = temperature command
-            await self._client.write_gatt_char(self.char_uuid, command)
+            await client.disconnect()
         except Exception as err:
-            _LOGGER.error("Error setting temperature: %s", err)
-            if self._client and self._client.is_connected:
-                await self._client.disconnect()
-            self._client = None
-            raise
+            _LOGGER.debug("Error closing connection to kettle %s: %s", self.address, err)
 
     async def disconnect(self):
-        """Disconnect from the kettle."""
-        if self._client and self._client.is_connected:
-            await self._client.disconnect()
-        self._client = None
+        """Disconnect from the kettle for good, including any background disconnect.
+
+        Waits for an in-flight poll or command to finish, so it cannot
+        reconnect or use the client after it has been closed.
+        """
+        async with self._lock:
+            self._closed = True
+            client = self._client
+            was_connected = self._is_connected
+            self._client = None
+            self._is_connected = False
+            self._authenticated = False
+            if client is not None and was_connected:
+                await self._close_client(client)
+            if self._disconnect_task is not None:
+                await self._disconnect_task
+                self._disconnect_task = None
 
-    def parse_notifications(self, notifications):
-        """Parse BLE notification payloads into kettle state.
+    def parse_notifications(self, buf) -> KettleState:
+        """Parse buffered BLE notification bytes into kettle state.
 
-        Expected frame format comes in two notifications:
-          First notification:
-            - Bytes 0-1: Magic (0xef, 0xdd)
-            - Byte 2: Message type
-          Second notification:
-            - Payload data
+        Notifications are accumulated into a single buffer. Each frame is a
+        header followed by its payload:
+          - Bytes 0-1: Magic (0xef, 0xdd)
+          - Byte 2: Message type
+          - Bytes 3+: Payload data
 
         Reverse engineered types:
           - Type 0: Power (1 = on, 0 = off)
@@ -162,48 +390,19 @@ class KettleBLEClient:
           - Type 8: Kettle position (0 = lifted, 1 = on base)
         """
         state = {}
-        i = 0
-        while i < len(notifications) - 1:  # Process pairs of notifications
-            header = notifications[i]
-            payload = notifications[i + 1]
-            
-            if len(header) < 3 or header[0] != 0xEF or header[1] != 0xDD:
-                i += 1
-                continue
-                
-            msg_type = header[2]
-            
-            if msg_type == 0:
-                # Power state
-                if len(payload) >= 1:
-                    state["power"] = payload[0] == 1
-            elif msg_type == 1:
-                # Hold state
-                if len(payload) >= 1:
-                    state["hold"] = payload[0] == 1
-            elif msg_type == 2:
-                # Target temperature
-                if len(payload) >= 2:
-                    temp = payload[0]  # Single byte temperature
-                    is_fahrenheit = payload[1] == 1
-                    state["target_temp"] = temp
-                    state["units"] = "F" if is_fahrenheit else "C"
-            elif msg_type == 3:
-                # Current temperature
-                if len(payload) >= 2:
-                    temp = payload[0]  # Single byte temperature
-                    is_fahrenheit = payload[1] == 1
-                    state["current_temp"] = temp
-                    state["units"] = "F" if is_fahrenheit else "C"
-            elif msg_type == 4:
-                # Countdown
-                if len(payload) >= 1:
-                    state["countdown"] = payload[0]
-            elif msg_type == 8:
-                # Kettle position
-                if len(payload) >= 1:
-                    state["lifted"] = payload[0] == 0
-            
-            i += 2  # Move to next pair of notifications
-            
-        return state
+        with memoryview(buf) as mv:
+            end = len(mv)
+            i = buf.find(_FRAME_MAGIC)
+            while i != -1 and i + 2 < end:
+                magic, msg_type = _FRAME_HEADER.unpack_from(mv, i)
+                handler = _MSG_HANDLERS.get(msg_type)
+                if magic != 0xEFDD or handler is None or i + handler[0] > end:
+                    # Not a known, complete frame; resync on the next magic
+                    i = buf.find(_FRAME_MAGIC, i + 1)
+                    continue
+
+                frame_len, parse = handler
+                parse(mv, i + 3, state)
+                i += frame_len  # Move to next frame
+
+        return KettleState(**state)
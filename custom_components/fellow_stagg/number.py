@@ -1,7 +1,6 @@
 """Number platform for Fellow Stagg EKG+ kettle."""
 from __future__ import annotations
 
-import asyncio
 import logging
 from datetime import timedelta
 from typing import Any
@@ -11,7 +10,6 @@ from homeassistant.components.number import (
   NumberMode,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import UnitOfTemperature
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.entity import EntityCategory
@@ -63,28 +61,22 @@ class FellowStaggTargetTemperature(NumberEntity):
   @property
   def native_value(self) -> float | None:
     """Return the current target temperature."""
-    value = self.coordinator.data.get("target_temp")
-    _LOGGER.debug("Target temperature read as: %s°%s", value, self.coordinator.temperature_unit)
-    return value
+    return self.coordinator.data.target_temp if self.coordinator.data is not None else None
 
   async def async_set_native_value(self, value: float) -> None:
     """Set new target temperature."""
-    _LOGGER.debug(
-      "Setting target temperature to %s°%s",
-      value,
-      self.coordinator.temperature_unit
-    )
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+      _LOGGER.debug(
+        "Setting target temperature to %s°%s",
+        value,
+        self.coordinator.temperature_unit
+      )
     
-    await self.coordinator.kettle.async_set_temperature(
-      self.coordinator.ble_device,
-      int(value),
-      fahrenheit=self.coordinator.temperature_unit == UnitOfTemperature.FAHRENHEIT
-    )
-    _LOGGER.debug("Target temperature command sent, waiting before refresh")
-    # Give the kettle a moment to update its internal state
-    await asyncio.sleep(0.5)
-    _LOGGER.debug("Requesting refresh after temperature change")
-    await self.coordinator.async_request_refresh()
+    self.coordinator.async_set_optimistic_data(target_temp=int(value))
+    # Not a CoordinatorEntity, so push the optimistic value before the write
+    self.async_write_ha_state()
+    await self.coordinator.async_set_target_temp(int(value))
+    _LOGGER.debug("Target temperature command submitted")
 
 
 class FellowStaggPollingInterval(CoordinatorEntity, NumberEntity):
@@ -121,5 +113,7 @@ class FellowStaggPollingInterval(CoordinatorEntity, NumberEntity):
     entry = self.hass.config_entries.async_get_entry(self.coordinator.entry_id)
     if entry is not None:
       self.hass.config_entries.async_update_entry(entry, options={**entry.options, CONF_POLLING_INTERVAL: seconds})
-    self.coordinator.update_interval = timedelta(seconds=seconds)
+    self.coordinator.idle_update_interval = timedelta(seconds=seconds)
+    if not (self.coordinator.data is not None and self.coordinator.data.power):
+      self.coordinator.update_interval = self.coordinator.idle_update_interval
     self.async_write_ha_state()
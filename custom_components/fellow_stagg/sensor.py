@@ -9,12 +9,13 @@ from homeassistant.components.sensor import (
     SensorEntityDescription,
 )
 from homeassistant.const import UnitOfTemperature
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import FellowStaggDataUpdateCoordinator
 from .const import DOMAIN
+from .kettle_ble import KettleState
 
 
 @dataclass
@@ -22,14 +23,15 @@ class FellowStaggSensorEntityDescription(SensorEntityDescription):
     """Description of a Fellow Stagg sensor."""
 
 
-# Define value functions separately to avoid serialization issues
-VALUE_FUNCTIONS: dict[str, Callable[[dict[str, Any] | None], Any | None]] = {
-    "power": lambda data: "On" if data and data.get("power") else "Off",
-    "current_temp": lambda data: data.get("current_temp") if data else None,
-    "target_temp": lambda data: data.get("target_temp") if data else None,
-    "hold": lambda data: "Hold" if data and data.get("hold") else "Normal",
-    "lifted": lambda data: "Lifted" if data and data.get("lifted") else "On Base",
-    "countdown": lambda data: data.get("countdown") if data else None,
+# Define value functions separately to avoid serialization issues.
+# Callers only invoke these with data present.
+VALUE_FUNCTIONS: dict[str, Callable[[KettleState], Any | None]] = {
+    "power": lambda data: "On" if data.power else "Off",
+    "current_temp": lambda data: data.current_temp,
+    "target_temp": lambda data: data.target_temp,
+    "hold": lambda data: "Hold" if data.hold else "Normal",
+    "lifted": lambda data: "Lifted" if data.lifted else "On Base",
+    "countdown": lambda data: data.countdown,
 }
 
 
@@ -76,6 +78,14 @@ def get_sensor_descriptions() -> list[FellowStaggSensorEntityDescription]:
 # Get sensor descriptions once at module load
 SENSOR_DESCRIPTIONS = get_sensor_descriptions()
 
+# Pair each description with its value function once, at module load
+SENSORS: tuple[
+    tuple[FellowStaggSensorEntityDescription, Callable[[KettleState], Any | None]], ...
+] = tuple(
+    (description, VALUE_FUNCTIONS[description.key])
+    for description in SENSOR_DESCRIPTIONS
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -86,8 +96,8 @@ async def async_setup_entry(
     coordinator: FellowStaggDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
     async_add_entities(
-        FellowStaggSensor(coordinator, description)
-        for description in SENSOR_DESCRIPTIONS
+        FellowStaggSensor(coordinator, description, value_fn)
+        for description, value_fn in SENSORS
     )
 
 
@@ -101,23 +111,29 @@ class FellowStaggSensor(CoordinatorEntity[FellowStaggDataUpdateCoordinator], Sen
         self,
         coordinator: FellowStaggDataUpdateCoordinator,
         description: FellowStaggSensorEntityDescription,
+        value_fn: Callable[[KettleState], Any | None],
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
         self.entity_description = description
+        self._value_fn = value_fn
         self._attr_unique_id = f"{coordinator._address}_{description.key}"
         self._attr_device_info = coordinator.device_info
 
         # Update unit of measurement based on kettle's current units
         if description.device_class == SensorDeviceClass.TEMPERATURE:
-            is_fahrenheit = coordinator.data.get("units") == "F"
-            self._attr_native_unit_of_measurement = (
-                UnitOfTemperature.FAHRENHEIT if is_fahrenheit else UnitOfTemperature.CELSIUS
-            )
-
-    @property
-    def native_value(self) -> str | None:
-        """Return the state of the sensor."""
+            self._attr_native_unit_of_measurement = coordinator.temperature_unit
+
+        self._attr_native_value = self._compute_native_value()
+
+    def _compute_native_value(self) -> str | None:
+        """Compute the state of the sensor from coordinator data."""
         if self.coordinator.data is None:
             return None
-        return VALUE_FUNCTIONS[self.entity_description.key](self.coordinator.data)
+        return self._value_fn(self.coordinator.data)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Cache the new value once per coordinator update."""
+        self._attr_native_value = self._compute_native_value()
+        super()._handle_coordinator_update()
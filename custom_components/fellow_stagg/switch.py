@@ -1,15 +1,15 @@
 """Switch platform for Fellow Stagg EKG+ kettle."""
 from __future__ import annotations
 
-import asyncio
 import logging
 from typing import Any
 
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.entity import EntityCategory
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import FellowStaggDataUpdateCoordinator
 from .const import DOMAIN
@@ -25,7 +25,7 @@ async def async_setup_entry(
   coordinator: FellowStaggDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
   async_add_entities([FellowStaggPowerSwitch(coordinator)])
 
-class FellowStaggPowerSwitch(SwitchEntity):
+class FellowStaggPowerSwitch(CoordinatorEntity[FellowStaggDataUpdateCoordinator], SwitchEntity):
   """Switch class for Fellow Stagg kettle power control."""
 
   _attr_has_entity_name = True
@@ -33,37 +33,38 @@ class FellowStaggPowerSwitch(SwitchEntity):
 
   def __init__(self, coordinator: FellowStaggDataUpdateCoordinator) -> None:
     """Initialize the switch."""
-    super().__init__()
-    self.coordinator = coordinator
+    super().__init__(coordinator)
     self._attr_unique_id = f"{coordinator._address}_power"
     self._attr_device_info = coordinator.device_info
+    self._update_from_data()
     _LOGGER.debug("Initialized power switch for %s", coordinator._address)
 
-  @property
-  def is_on(self) -> bool | None:
-    """Return true if the switch is on."""
-    value = self.coordinator.data.get("power")
-    _LOGGER.debug("Power switch state read as: %s", value)
-    return value
+  def _update_from_data(self) -> None:
+    """Cache the power state from coordinator data."""
+    self._attr_is_on = self.coordinator.data.power if self.coordinator.data is not None else None
+
+  @callback
+  def _handle_coordinator_update(self) -> None:
+    """Handle updated data from the coordinator."""
+    self._update_from_data()
+    super()._handle_coordinator_update()
 
   async def async_turn_on(self, **kwargs: Any) -> None:
     """Turn the switch on."""
+    if self.is_on:
+      _LOGGER.debug("Power switch already ON, skipping command")
+      return
     _LOGGER.debug("Turning power switch ON")
-    ble_device = self.coordinator.get_ble_device_for_connect()
-    await self.coordinator.kettle.async_set_power(ble_device, True)
-    _LOGGER.debug("Power ON command sent, waiting before refresh")
-    # Give the kettle a moment to update its internal state
-    await asyncio.sleep(0.5)
-    _LOGGER.debug("Requesting refresh after power change")
-    await self.coordinator.async_request_refresh()
+    self.coordinator.async_set_optimistic_data(power=True)
+    await self.coordinator.async_set_power(True)
+    _LOGGER.debug("Power ON command submitted")
 
   async def async_turn_off(self, **kwargs: Any) -> None:
     """Turn the switch off."""
+    if self.is_on is False:
+      _LOGGER.debug("Power switch already OFF, skipping command")
+      return
     _LOGGER.debug("Turning power switch OFF")
-    ble_device = self.coordinator.get_ble_device_for_connect()
-    await self.coordinator.kettle.async_set_power(ble_device, False)
-    _LOGGER.debug("Power OFF command sent, waiting before refresh")
-    # Give the kettle a moment to update its internal state
-    await asyncio.sleep(0.5)
-    _LOGGER.debug("Requesting refresh after power change")
-    await self.coordinator.async_request_refresh() 
+    self.coordinator.async_set_optimistic_data(power=False)
+    await self.coordinator.async_set_power(False)
+    _LOGGER.debug("Power OFF command submitted")
@@ -1,7 +1,6 @@
 """Water heater platform for Fellow Stagg EKG+ kettle."""
 from __future__ import annotations
 
-import asyncio
 import logging
 from typing import Any
 
@@ -10,12 +9,10 @@ from homeassistant.components.water_heater import (
   WaterHeaterEntityFeature,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import (
-  ATTR_TEMPERATURE,
-  UnitOfTemperature,
-)
-from homeassistant.core import HomeAssistant
+from homeassistant.const import ATTR_TEMPERATURE
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import FellowStaggDataUpdateCoordinator
 from .const import DOMAIN
@@ -31,7 +28,7 @@ async def async_setup_entry(
   coordinator: FellowStaggDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
   async_add_entities([FellowStaggWaterHeater(coordinator)])
 
-class FellowStaggWaterHeater(WaterHeaterEntity):
+class FellowStaggWaterHeater(CoordinatorEntity[FellowStaggDataUpdateCoordinator], WaterHeaterEntity):
   """Water heater entity for Fellow Stagg kettle."""
 
   _attr_has_entity_name = True
@@ -44,8 +41,7 @@ class FellowStaggWaterHeater(WaterHeaterEntity):
 
   def __init__(self, coordinator: FellowStaggDataUpdateCoordinator) -> None:
     """Initialize the water heater."""
-    super().__init__()
-    self.coordinator = coordinator
+    super().__init__(coordinator)
     self._attr_unique_id = f"{coordinator._address}_water_heater"
     self._attr_device_info = coordinator.device_info
 
@@ -62,29 +58,25 @@ class FellowStaggWaterHeater(WaterHeaterEntity):
       self._attr_max_temp,
       self._attr_temperature_unit,
     )
+    self._update_from_data()
+
+  def _update_from_data(self) -> None:
+    """Cache current/target temperature and operation from coordinator data."""
+    data = self.coordinator.data
+    if data is None:
+      self._attr_current_temperature = None
+      self._attr_target_temperature = None
+      self._attr_current_operation = None
+      return
+    self._attr_current_temperature = data.current_temp
+    self._attr_target_temperature = data.target_temp
+    self._attr_current_operation = "on" if data.power else "off"
 
-  @property
-  def current_temperature(self) -> float | None:
-    """Return the current temperature."""
-    value = self.coordinator.data.get("current_temp") if self.coordinator.data else None
-    _LOGGER.debug("Water heater current temperature read as: %s°%s", value, self.coordinator.temperature_unit)
-    return value
-
-  @property
-  def target_temperature(self) -> float | None:
-    """Return the target temperature."""
-    value = self.coordinator.data.get("target_temp") if self.coordinator.data else None
-    _LOGGER.debug("Water heater target temperature read as: %s°%s", value, self.coordinator.temperature_unit)
-    return value
-
-  @property
-  def current_operation(self) -> str | None:
-    """Return current operation."""
-    if not self.coordinator.data:
-      return None
-    value = "on" if self.coordinator.data.get("power") else "off"
-    _LOGGER.debug("Water heater operation state read as: %s", value)
-    return value
+  @callback
+  def _handle_coordinator_update(self) -> None:
+    """Handle updated data from the coordinator."""
+    self._update_from_data()
+    super()._handle_coordinator_update()
 
   async def async_set_temperature(self, **kwargs: Any) -> None:
     """Set new target temperature."""
@@ -92,39 +84,27 @@ class FellowStaggWaterHeater(WaterHeaterEntity):
     if temperature is None:
       return
 
-    _LOGGER.debug(
-      "Setting water heater target temperature to %s°%s",
-      temperature,
-      self.coordinator.temperature_unit
-    )
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+      _LOGGER.debug(
+        "Setting water heater target temperature to %s°%s",
+        temperature,
+        self.coordinator.temperature_unit
+      )
     
-    await self.coordinator.kettle.async_set_temperature(
-      self.coordinator.ble_device,
-      int(temperature),
-      fahrenheit=self.coordinator.temperature_unit == UnitOfTemperature.FAHRENHEIT
-    )
-    _LOGGER.debug("Target temperature command sent, waiting before refresh")
-    # Give the kettle a moment to update its internal state
-    await asyncio.sleep(0.5)
-    _LOGGER.debug("Requesting refresh after temperature change")
-    await self.coordinator.async_request_refresh()
+    self.coordinator.async_set_optimistic_data(target_temp=int(temperature))
+    await self.coordinator.async_set_target_temp(int(temperature))
+    _LOGGER.debug("Target temperature command submitted")
 
   async def async_turn_on(self, **kwargs: Any) -> None:
     """Turn the water heater on."""
     _LOGGER.debug("Turning water heater ON")
-    await self.coordinator.kettle.async_set_power(self.coordinator.ble_device, True)
-    _LOGGER.debug("Power ON command sent, waiting before refresh")
-    # Give the kettle a moment to update its internal state
-    await asyncio.sleep(0.5)
-    _LOGGER.debug("Requesting refresh after power change")
-    await self.coordinator.async_request_refresh()
+    self.coordinator.async_set_optimistic_data(power=True)
+    await self.coordinator.async_set_power(True)
+    _LOGGER.debug("Power ON command submitted")
 
   async def async_turn_off(self, **kwargs: Any) -> None:
     """Turn the water heater off."""
     _LOGGER.debug("Turning water heater OFF")
-    await self.coordinator.kettle.async_set_power(self.coordinator.ble_device, False)
-    _LOGGER.debug("Power OFF command sent, waiting before refresh")
-    # Give the kettle a moment to update its internal state
-    await asyncio.sleep(0.5)
-    _LOGGER.debug("Requesting refresh after power change")
-    await self.coordinator.async_request_refresh() 
+    self.coordinator.async_set_optimistic_data(power=False)
+    await self.coordinator.async_set_power(False)
+    _LOGGER.debug("Power OFF command submitted")